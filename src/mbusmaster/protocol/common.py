@@ -5,15 +5,17 @@ This module contains fundamental types used throughout the protocol layer.
 Reference: EN 13757-3:2018
 """
 
-from enum import Flag, auto
+from enum import IntFlag, auto
 
 
-class CommunicationDirection(Flag):
+class CommunicationDirection(IntFlag):
     """Represents the actual direction of communication.
 
     Only two directions exist:
     - MASTER_TO_SLAVE: Data flows from master (e.g., commands, requests)
     - SLAVE_TO_MASTER: Data flows from slave (e.g., responses, data)
+
+    IntFlag so members hash as plain ints when used as lookup and cache keys.
     """
 
     MASTER_TO_SLAVE = auto()
@@ -180,14 +180,9 @@ def _decode_type_d(data: bytes) -> BooleanArrayValue:
         data: Raw bytes
 
     Returns:
-        List of boolean values (one per bit)
+        Bit array packed into an int bitmap (one element per bit)
     """
-    bits: list[bool] = []
-    for byte_val in data:
-        for bit_pos in range(8):
-            bits.append(bool((byte_val >> bit_pos) & 1))
-
-    return BooleanArrayValue(True, tuple(bits))
+    return BooleanArrayValue(True, int.from_bytes(data, byteorder="little"), len(data) * 8)
 
 
 # =============================================================================
@@ -637,6 +632,12 @@ class LVARType(Enum):
     )
 
 
+# LVARType for each LVAR byte value (None for reserved codes), so parsing needs no scan over members
+_LVAR_TYPE_BY_CODE: tuple[LVARType | None, ...] = tuple(
+    next((lvar_type for lvar_type in LVARType if code in lvar_type.value.code_range), None) for code in range(256)
+)
+
+
 class DataType(Enum):
     """M-Bus data types with 32-bit flag encoding for validation.
 
@@ -806,10 +807,11 @@ class DataRules:
 
     def __new__(cls, supports: Supports, requires: Requires) -> DataType | None:  # type: ignore[misc]
         for required_value in requires.value:
-            final_value = supports.value & required_value
+            # Read the member map directly instead of going through EnumMeta.__call__
+            data_type = DataType._value2member_map_.get(supports.value & required_value)
 
-            if final_value in DataType._value2member_map_:
-                return DataType(final_value)
+            if data_type is not None:
+                return data_type  # type: ignore[return-value]
 
             if not requires.any_valid:
                 break
@@ -1009,30 +1011,25 @@ class Data:
 
         data_length: int | None = data_type.length
 
-        data_bytes: bytearray = bytearray()
+        if data_length is not None:
+            # Fixed-length payload is handed to Data as read, without copying it through a buffer
+            return Data(await get_next_bytes(data_length), data_type, None)
 
-        lvar_type: LVARType | None = None
+        lvar_bytes: bytes = await get_next_bytes(1)
 
-        if data_length is None:
-            lvar_bytes: bytes = await get_next_bytes(1)
+        if len(lvar_bytes) != 1:
+            raise ValueError("LVAR byte must be exactly 1 byte")
 
-            if len(lvar_bytes) != 1:
-                raise ValueError("LVAR byte must be exactly 1 byte")
+        lvar_code: int = lvar_bytes[0]
 
-            data_bytes.extend(lvar_bytes)
+        lvar_type = _LVAR_TYPE_BY_CODE[lvar_code]
 
-            lvar_code: int = lvar_bytes[0]
+        if lvar_type is None:
+            raise ValueError(f"Unsupported LVAR code: 0x{lvar_code:02X}")
 
-            for lvar_member in LVARType:
-                if lvar_code in lvar_member.value.code_range:
-                    lvar_type = lvar_member
-                    break
-            else:
-                raise ValueError(f"Unsupported LVAR code: 0x{lvar_code:02X}")
-
-            data_length = lvar_type.value.length_calculator(lvar_code)
+        data_length = lvar_type.value.length_calculator(lvar_code)
 
         if data_length > 0:
-            data_bytes.extend(await get_next_bytes(data_length))
+            lvar_bytes += await get_next_bytes(data_length)
 
-        return Data(bytes(data_bytes), data_type, lvar_type)
+        return Data(lvar_bytes, data_type, lvar_type)
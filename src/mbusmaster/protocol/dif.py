@@ -357,7 +357,10 @@ class DIF:
 
         dif: DIF = DIF(direction, dif_bytes[0])
 
-        dife_list: list[DIFE] = []
+        # Most chains carry no DIFE at all, so start from the final one-element tuple
+        # and allocate no list. Tuples are immutable, so each DIFE builds a new, longer
+        # tuple; chains are capped at DIFE_MAXIMUM_CHAIN_LENGTH, which keeps that cheap
+        chain: tuple[DIF, *tuple[DIFE, ...]] = (dif,)
 
         current_field: DIF = dif
         while not current_field.last_field:
@@ -367,9 +370,9 @@ class DIF:
                 raise ValueError("Expected exactly one byte for DIFE")
 
             current_field = current_field.create_next_dife(dife_bytes[0])
-            dife_list.append(current_field)
+            chain += (current_field,)
 
-        return (dif, *dife_list)
+        return chain
 
 
 class DataDIF(DIF):
@@ -11,9 +11,10 @@ time/date types with support for:
 Reference: EN 13757-3:2018, Annex A
 """
 
-from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
 from datetime import UTC, date, datetime, time, timedelta, timezone
-from enum import Enum, StrEnum, member
+from enum import Enum, StrEnum
+from functools import lru_cache
 
 
 class ValueUnit(StrEnum):
@@ -70,8 +71,19 @@ class ValueUnit(StrEnum):
     DBM = "dBm"  # Decibel-milliwatts (RF signal level)
 
 
+def _metric_to_imperial(unit: str, _code: int) -> str:
+    return ValueUnit.FEET3 if unit == ValueUnit.M3 else unit
+
+
 class ValueUnitTransformer(Enum):
-    METRIC_TO_IMPERIAL = member(lambda unit, _code: "ft³" if unit == "m³" else unit)
+    METRIC_TO_IMPERIAL = 0
+
+    def __call__(self, unit: str, code: int) -> str:
+        return _VALUE_UNIT_TRANSFORMERS[self._value_](unit, code)
+
+
+# Plain functions indexed by ValueUnitTransformer member value (no Enum value descriptor on call)
+_VALUE_UNIT_TRANSFORMERS: tuple[Callable[[str, int], str], ...] = (_metric_to_imperial,)
 
 
 class ValueDescription(StrEnum):
@@ -376,20 +388,34 @@ class ValueDescription(StrEnum):
     DIRECTION_FROM_METER = "Direction: from meter to communication partner"
 
 
+def _append_per_second(description: str, _code: int) -> str:
+    return f"{description} per second"
+
+
 class ValueDescriptionTransformer(Enum):
-    APPEND_PER_SECOND = member(lambda description, _code: f"{description} per second")
+    APPEND_PER_SECOND = 0
 
     def __call__(self, description: str, code: int) -> str:
-        return self.value(description, code)
+        return _VALUE_DESCRIPTION_TRANSFORMERS[self._value_](description, code)
+
+
+# Plain functions indexed by ValueDescriptionTransformer member value (no Enum value descriptor on call)
+_VALUE_DESCRIPTION_TRANSFORMERS: tuple[Callable[[str, int], str], ...] = (_append_per_second,)
 
 
 class ValueTransformer(Enum):
     """Value transformation functions for M-Bus VIF/VIFE codes.
 
-    Each member is a function that takes (value, code) and returns the transformed value.
+    Each member is callable with (value, code) and returns the transformed value.
     - value: The raw numeric value to transform
     - code: The VIF/VIFE code byte containing bit-encoded parameters
 
+    The scale, divisor and offset for each member and each possible code byte
+    are precomputed once at import time into _VALUE_TRANSFORMER_TABLE, indexed
+    by the member value. A call is then a single table lookup followed by the
+    same arithmetic the formula below describes, so results are bit-identical
+    to evaluating it directly.
+
     Naming convention:
         MULT_10_POW_{bits}_{offset} = Multiplicative: value * 10^((code & mask) + offset)
         ADD_10_POW_{bits}_{offset} = Additive: value + 10^((code & mask) + offset)
@@ -400,48 +426,48 @@ class ValueTransformer(Enum):
         ADD_10_POW_NN_MINUS_3 → value + 10^((code & 0x03) - 3)
 
     Usage:
-        transform = _ValueTransformer.MULT_10_POW_NNN_MINUS_3
+        transform = ValueTransformer.MULT_10_POW_NNN_MINUS_3
         result = transform(1042, 0x03)  # Calls the method directly
     """
 
     # === POWER OF 10: nnn bits (3 bits, mask 0x07) ===
-    MULT_10_POW_NNN_MINUS_3 = member(lambda value, code: value * 10 ** ((code & 0x07) - 3))
-    MULT_10_POW_NNN = member(lambda value, code: value * 10 ** (code & 0x07))
-    MULT_10_POW_NNN_MINUS_6 = member(lambda value, code: value * 10 ** ((code & 0x07) - 6))
-    MULT_10_POW_NNN_MINUS_7 = member(lambda value, code: value * 10 ** ((code & 0x07) - 7))
-    MULT_10_POW_NNN_MINUS_9 = member(lambda value, code: value * 10 ** ((code & 0x07) - 9))
+    MULT_10_POW_NNN_MINUS_3 = 0
+    MULT_10_POW_NNN = 1
+    MULT_10_POW_NNN_MINUS_6 = 2
+    MULT_10_POW_NNN_MINUS_7 = 3
+    MULT_10_POW_NNN_MINUS_9 = 4
 
     # === POWER OF 10: nn bits (2 bits, mask 0x03) ===
-    MULT_10_POW_NN_MINUS_3 = member(lambda value, code: value * 10 ** ((code & 0x03) - 3))
-    MULT_10_POW_NN = member(lambda value, code: value * 10 ** (code & 0x03))
-    MULT_10_POW_NN_PLUS_5 = member(lambda value, code: value * 10 ** ((code & 0x03) + 5))
+    MULT_10_POW_NN_MINUS_3 = 5
+    MULT_10_POW_NN = 6
+    MULT_10_POW_NN_PLUS_5 = 7
 
     # === POWER OF 10: n bit (1 bit, mask 0x01) ===
-    MULT_10_POW_N_MINUS_1 = member(lambda value, code: value * 10 ** ((code & 0x01) - 1))
-    MULT_10_POW_N = member(lambda value, code: value * 10 ** (code & 0x01))
-    MULT_10_POW_N_PLUS_2 = member(lambda value, code: value * 10 ** ((code & 0x01) + 2))
-    MULT_10_POW_N_PLUS_5 = member(lambda value, code: value * 10 ** ((code & 0x01) + 5))
-    MULT_10_POW_N_PLUS_8 = member(lambda value, code: value * 10 ** ((code & 0x01) + 8))
+    MULT_10_POW_N_MINUS_1 = 8
+    MULT_10_POW_N = 9
+    MULT_10_POW_N_PLUS_2 = 10
+    MULT_10_POW_N_PLUS_5 = 11
+    MULT_10_POW_N_PLUS_8 = 12
 
     # === POWER OF 10: nnnn bits (4 bits, mask 0x0F) ===
-    MULT_10_POW_NNNN_MINUS_9 = member(lambda value, code: value * 10 ** ((code & 0x0F) - 9))
-    MULT_10_POW_NNNN_MINUS_12 = member(lambda value, code: value * 10 ** ((code & 0x0F) - 12))
+    MULT_10_POW_NNNN_MINUS_9 = 13
+    MULT_10_POW_NNNN_MINUS_12 = 14
 
     # === POWER OF 10 WITH TIME CONVERSION ===
-    MULT_10_POW_NNN_MINUS_6_DIV_3600 = member(lambda value, code: value * 10 ** ((code & 0x07) - 6) / 3600)
-    MULT_10_POW_NNN_MINUS_7_DIV_60 = member(lambda value, code: value * 10 ** ((code & 0x07) - 7) / 60)
-    MULT_10_POW_NNN_MINUS_3_DIV_3600 = member(lambda value, code: value * 10 ** ((code & 0x07) - 3) / 3600)
+    MULT_10_POW_NNN_MINUS_6_DIV_3600 = 15
+    MULT_10_POW_NNN_MINUS_7_DIV_60 = 16
+    MULT_10_POW_NNN_MINUS_3_DIV_3600 = 17
 
     # === POWER OF 2 ===
-    MULT_2_POW_MINUS_12 = member(lambda value, _code: value * 2 ** (-12))
+    MULT_2_POW_MINUS_12 = 18
 
     # === FIXED VALUES ===
-    MULT_1000 = member(lambda value, _code: value * 1000.0)
-    MULT_1 = member(lambda value, _code: value * 1.0)
-    MULT_0_1 = member(lambda value, _code: value * 0.1)
+    MULT_1000 = 19
+    MULT_1 = 20
+    MULT_0_1 = 21
 
     # === ADDITIVE ===
-    ADD_10_POW_NN_MINUS_3 = member(lambda value, code: value + 10 ** ((code & 0x03) - 3))
+    ADD_10_POW_NN_MINUS_3 = 22
 
     def __call__(self, value: float, code: int) -> float:
         """Allow calling the enum member directly as a function.
@@ -453,7 +479,71 @@ class ValueTransformer(Enum):
         Returns:
             The transformed value
         """
-        return float(self.value(value, code))
+        scale, divisor, offset = _VALUE_TRANSFORMER_TABLE[self._value_][code & 0xFF]
+        if offset:
+            return float(value + offset)
+        if divisor == 1:
+            return float(value * scale)
+        # Divide rather than fold the divisor into the scale, which can differ by one ulp
+        return float(value * scale / divisor)
+
+
+# Powers of ten 10^-12 .. 10^15 (every exponent reachable from a VIF/VIFE code), indexed by exponent + 12.
+# Computed as 10**exponent like the transformer formulas, so non-negative exponents stay exact ints.
+_POW10_MIN_EXPONENT = -12
+_POW10: tuple[float, ...] = tuple(10**exponent for exponent in range(_POW10_MIN_EXPONENT, 16))
+
+
+def _tabulate_value_transformer(
+    mask: int, terms: tuple[tuple[float, int, float], ...]
+) -> tuple[tuple[float, int, float], ...]:
+    """Expand (scale, divisor, offset) terms indexed by the code bits into a row for all 256 code bytes.
+
+    Args:
+        mask: Bit mask selecting the parameter bits of the code byte
+        terms: (scale, divisor, offset) triples indexed by code & mask
+
+    Returns:
+        Tuple of 256 (scale, divisor, offset) triples indexed by the full code byte
+    """
+    return tuple(terms[code & mask] for code in range(256))
+
+
+def _power_of_10_scales(mask: int, exponent: int, divisor: int = 1) -> tuple[tuple[float, int, float], ...]:
+    """Build the row for value * 10^((code & mask) + exponent) / divisor."""
+    return _tabulate_value_transformer(
+        mask, tuple((_POW10[n + exponent - _POW10_MIN_EXPONENT], divisor, 0) for n in range(mask + 1))
+    )
+
+
+# Precomputed (scale, divisor, offset) per ValueTransformer member value and code byte
+_VALUE_TRANSFORMER_TABLE: tuple[tuple[tuple[float, int, float], ...], ...] = (
+    _power_of_10_scales(0x07, -3),  # MULT_10_POW_NNN_MINUS_3
+    _power_of_10_scales(0x07, 0),  # MULT_10_POW_NNN
+    _power_of_10_scales(0x07, -6),  # MULT_10_POW_NNN_MINUS_6
+    _power_of_10_scales(0x07, -7),  # MULT_10_POW_NNN_MINUS_7
+    _power_of_10_scales(0x07, -9),  # MULT_10_POW_NNN_MINUS_9
+    _power_of_10_scales(0x03, -3),  # MULT_10_POW_NN_MINUS_3
+    _power_of_10_scales(0x03, 0),  # MULT_10_POW_NN
+    _power_of_10_scales(0x03, 5),  # MULT_10_POW_NN_PLUS_5
+    _power_of_10_scales(0x01, -1),  # MULT_10_POW_N_MINUS_1
+    _power_of_10_scales(0x01, 0),  # MULT_10_POW_N
+    _power_of_10_scales(0x01, 2),  # MULT_10_POW_N_PLUS_2
+    _power_of_10_scales(0x01, 5),  # MULT_10_POW_N_PLUS_5
+    _power_of_10_scales(0x01, 8),  # MULT_10_POW_N_PLUS_8
+    _power_of_10_scales(0x0F, -9),  # MULT_10_POW_NNNN_MINUS_9
+    _power_of_10_scales(0x0F, -12),  # MULT_10_POW_NNNN_MINUS_12
+    _power_of_10_scales(0x07, -6, 3600),  # MULT_10_POW_NNN_MINUS_6_DIV_3600
+    _power_of_10_scales(0x07, -7, 60),  # MULT_10_POW_NNN_MINUS_7_DIV_60
+    _power_of_10_scales(0x07, -3, 3600),  # MULT_10_POW_NNN_MINUS_3_DIV_3600
+    _tabulate_value_transformer(0x00, ((2**-12, 1, 0),)),  # MULT_2_POW_MINUS_12
+    _tabulate_value_transformer(0x00, ((1000.0, 1, 0),)),  # MULT_1000
+    _tabulate_value_transformer(0x00, ((1.0, 1, 0),)),  # MULT_1
+    _tabulate_value_transformer(0x00, ((0.1, 1, 0),)),  # MULT_0_1
+    _tabulate_value_transformer(
+        0x03, tuple((1, 1, _POW10[n - 3 - _POW10_MIN_EXPONENT]) for n in range(4))
+    ),  # ADD_10_POW_NN_MINUS_3
+)
 
 
 class ValueFunction(StrEnum):
@@ -463,54 +553,224 @@ class ValueFunction(StrEnum):
     ERROR = "error"
 
 
-class Value(ABC):
-    # Validity (all types)
-    is_valid: bool
+class Value:
+    # Plain base (no ABCMeta): it declares no abstract methods, only the is_valid contract.
+    # Empty so int/float/str subclasses keep their native layout; concrete
+    # non-builtin subclasses declare is_valid in their own __slots__
+    __slots__ = ()
 
-    @abstractmethod
-    def __init__(self, is_valid: bool) -> None:
-        self.is_valid = is_valid
+    # Validity (all types), set by each subclass at construction
+    is_valid: bool
 
 
 class IntegerValue(int, Value):
+    # int subclasses cannot declare non-empty __slots__, so is_valid lives in the instance dict
+
     def __new__(cls, is_valid: bool, numeric_value: int = 0) -> "IntegerValue":
         # Create int object with the numeric value
         instance = super().__new__(cls, numeric_value)
+        instance.is_valid = is_valid
         return instance
 
-    def __init__(self, is_valid: bool, numeric_value: int = 0) -> None:
-        # Don't call int.__init__, call Value.__init__ directly
-        Value.__init__(self, is_valid)
-
 
 class FloatValue(float, Value):
+    __slots__ = ("is_valid",)
+
     def __new__(cls, is_valid: bool, numeric_value: float = 0.0) -> "FloatValue":
         # Create float object with the numeric value
         instance = super().__new__(cls, numeric_value)
+        instance.is_valid = is_valid
         return instance
 
-    def __init__(self, is_valid: bool, numeric_value: float = 0.0) -> None:
-        # Don't call float.__init__, call Value.__init__ directly
-        Value.__init__(self, is_valid)
-
 
 class StringValue(str, Value):
+    __slots__ = ("is_valid",)
+
     def __new__(cls, is_valid: bool, string_value: str = "") -> "StringValue":
         # Create str object with the string value
         instance = super().__new__(cls, string_value)
+        instance.is_valid = is_valid
         return instance
 
-    def __init__(self, is_valid: bool, string_value: str = "") -> None:
-        # Don't call str.__init__, call Value.__init__ directly
-        Value.__init__(self, is_valid)
-
 
 class BooleanArrayValue(Value):
-    boolean_array_value: tuple[bool, ...]
+    """Boolean bit array packed into an int bitmap.
+
+    Element i is bit i of bits (bit 0 = first element). Storing a single int
+    instead of a tuple of bool objects keeps each value a few words in size and
+    allows masks to be tested with plain bitwise operations.
+    """
+
+    __slots__ = ("is_valid", "bits", "length")
+
+    bits: int
+    length: int
+
+    def __init__(
+        self,
+        is_valid: bool,
+        bits: int | Iterable[bool] = (),
+        length: int | None = None,
+        *,
+        boolean_array_value: Iterable[bool] | None = None,
+    ) -> None:
+        """Initialize BooleanArrayValue.
+
+        Args:
+            is_valid: Validity flag
+            bits: Bitmap of the elements (bit i = element i), or the boolean
+                elements themselves (first element becomes bit 0)
+            length: Number of elements; required with an int bitmap, not allowed with boolean elements
+            boolean_array_value: The boolean elements, as accepted by the original constructor
+
+        Raises:
+            TypeError: If bits is a bool, length is missing for an int bitmap or given with
+                boolean elements, or both bits and boolean_array_value are given
+            ValueError: If an int bitmap is negative or has bits set at or above length
+        """
+        self.is_valid = is_valid
+
+        if boolean_array_value is not None:
+            if bits != ():
+                raise TypeError("pass either bits or boolean_array_value, not both")
+            bits = boolean_array_value
+
+        if isinstance(bits, bool):
+            raise TypeError("bits must be an int bitmap or boolean elements, not a bool")
+
+        if isinstance(bits, int):
+            if length is None:
+                raise TypeError("length is required with an int bitmap")
+            if bits < 0 or bits >> length:
+                raise ValueError(f"bitmap 0x{bits:X} does not fit in {length} elements")
+            self.bits = bits
+            self.length = length
+            return
+
+        if length is not None:
+            raise TypeError("length is only valid with an int bitmap")
+        packed = 0
+        count = 0
+        for flag in bits:
+            if flag:
+                packed |= 1 << count
+            count += 1
+        self.bits = packed
+        self.length = count
+
+    @property
+    def boolean_array_value(self) -> tuple[bool, ...]:
+        """Elements unpacked into a tuple of booleans."""
+        return tuple(self)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> bool:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("BooleanArrayValue index out of range")
+        return bool((self.bits >> index) & 1)
+
+    def __iter__(self) -> Iterator[bool]:
+        bits = self.bits
+        return (bool((bits >> index) & 1) for index in range(self.length))
+
+
+# Type M starting epochs indexed by epoch_start (0=2013-01-01, 1=1970-01-01 Unix epoch)
+_EPOCHS: tuple[datetime, datetime] = (
+    datetime(2013, 1, 1, 0, 0, 0, tzinfo=UTC),
+    datetime(1970, 1, 1, 0, 0, 0, tzinfo=UTC),
+)
+
+# Fixed-offset timezones for every Type M UTC offset (-12..+14 hours), shared across values
+_UTC_OFFSET_TIMEZONES: dict[int, timezone] = {hours: timezone(timedelta(hours=hours)) for hours in range(-12, 15)}
+
+# Zero-padded "00".."99" for the date/time components in TemporalValue.__str__
+# (every decoded component is bit-masked to at most 63)
+_TWO_DIGIT: tuple[str, ...] = tuple(f"{number:02d}" for number in range(100))
+
+
+def _two_digit(number: int) -> str:
+    """Zero-pad a date/time component, using _TWO_DIGIT for decoded values and formatting any other int."""
+    return _TWO_DIGIT[number] if 0 <= number < 100 else f"{number:02d}"
+
+
+# Rendered full years for TemporalValue.__str__, covering every year the Type F/G decoders produce
+_YEAR_STR: dict[int, str] = {year: str(year) for year in range(1900, 2300)}
+
+# %-format template for component-based TemporalValue.__str__ with date and HH:MM (Type F)
+_DATE_HOUR_MINUTE_FORMAT = "%s-%s-%s %s:%s"
+
+# %-format templates for epoch-based TemporalValue.__str__
+_DURATION_FORMAT = "Duration: %ss (res=%ss)"
+_EPOCH_FORMAT = "%s (UTC%+d, res=%ss)"
+
+# %-format templates for TemporalValue.__repr__
+_EPOCH_REPR_FORMAT = (
+    "ValueTemporal(epoch_seconds=%s, utc_offset_hours=%s, resolution_seconds=%s, epoch_start=%s, is_valid=%s)"
+)
+_COMPONENT_REPR_FORMAT = (
+    "ValueTemporal(year_2digit=%s, year_full=%s, month=%s, day=%s, hour=%s, minute=%s, second=%s, is_valid=%s)"
+)
+
+# Bits of TemporalValue._recurring_mask, one per recurring pattern
+_EVERY_YEAR = 1 << 0
+_EVERY_MONTH = 1 << 1
+_EVERY_DAY = 1 << 2
+_EVERY_HOUR = 1 << 3
+_EVERY_MINUTE = 1 << 4
+_EVERY_SECOND = 1 << 5
 
-    def __init__(self, is_valid: bool, boolean_array_value: tuple[bool, ...] = ()) -> None:
-        super().__init__(is_valid)
-        self.boolean_array_value = boolean_array_value
+
+@lru_cache(maxsize=1024)
+def _format_date(recurring_mask: int, year_full: int | None, month: int | None, day: int | None) -> str:
+    """Render the date part of a component-based TemporalValue.
+
+    Args:
+        recurring_mask: The value's _recurring_mask (_EVERY_* bits)
+        year_full: Full year or None
+        month: Month or None
+        day: Day or None
+
+    Returns:
+        "YYYY-MM-DD" with * for recurring and ? for missing components
+    """
+    if recurring_mask & _EVERY_YEAR:
+        year_str = "*"
+    else:
+        year_str = (_YEAR_STR.get(year_full) or str(year_full)) if year_full is not None else "?"
+    month_str = "*" if recurring_mask & _EVERY_MONTH else (_two_digit(month) if month is not None else "?")
+    day_str = "*" if recurring_mask & _EVERY_DAY else (_two_digit(day) if day is not None else "?")
+    return f"{year_str}-{month_str}-{day_str}"
+
+
+@lru_cache(maxsize=1024)
+def _format_time(recurring_mask: int, hour: int | None, minute: int | None, second: float | None) -> str:
+    """Render the time part of a component-based TemporalValue.
+
+    Args:
+        recurring_mask: The value's _recurring_mask (_EVERY_* bits)
+        hour: Hour or None
+        minute: Minute or None
+        second: Second with fractional part or None
+
+    Returns:
+        "HH:MM" or "HH:MM:SS[.fff]" with * for recurring and ? for missing components
+    """
+    hour_str = "*" if recurring_mask & _EVERY_HOUR else (_two_digit(hour) if hour is not None else "?")
+    minute_str = "*" if recurring_mask & _EVERY_MINUTE else (_two_digit(minute) if minute is not None else "?")
+
+    if second is None:
+        return f"{hour_str}:{minute_str}"
+
+    if recurring_mask & _EVERY_SECOND:
+        second_str = "*"
+    else:
+        # Handle fractional seconds
+        second_str = _two_digit(int(second)) if second.is_integer() else f"{second:06.3f}"
+    return f"{hour_str}:{minute_str}:{second_str}"
 
 
 class TemporalValue(Value):
@@ -531,6 +791,11 @@ class TemporalValue(Value):
 
     None = field not present or not specified for this type
 
+    Instances are treated as immutable once constructed: the recurring flags,
+    the representation flag and the rendered str/repr/datetime are derived from
+    the fields and cached, so assigning a field afterwards leaves them stale.
+    Build a new TemporalValue instead of modifying one.
+
     Examples:
         Component-based (Type F):
             >>> t = ValueTemporal(
@@ -562,6 +827,37 @@ class TemporalValue(Value):
             "1992-03-12 06:46:40+01:00 (UTC+1, res=1.0s)"
     """
 
+    __slots__ = (
+        "is_valid",
+        "year_2digit",
+        "year_full",
+        "month",
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "epoch_seconds",
+        "utc_offset_hours",
+        "resolution_seconds",
+        "epoch_start",
+        "is_summer_time",
+        "day_of_week",
+        "week",
+        "is_leap_year",
+        "daylight_savings_deviation",
+        "is_every_year",
+        "is_every_month",
+        "is_every_day",
+        "is_every_hour",
+        "is_every_minute",
+        "is_every_second",
+        "_recurring_mask",
+        "_is_epoch_based",
+        "_str_cache",
+        "_repr_cache",
+        "_datetime_cache",
+    )
+
     # Component-based fields (Types F, G, I, J)
     year_2digit: int | None
     year_full: int | None
@@ -584,6 +880,25 @@ class TemporalValue(Value):
     is_leap_year: bool | None
     daylight_savings_deviation: int | None
 
+    # Recurring patterns, computed once at construction
+    is_every_year: bool  # year_2digit == 127
+    is_every_month: bool  # month == 15
+    is_every_day: bool  # day == 0
+    is_every_hour: bool  # hour == 31
+    is_every_minute: bool  # minute == 63
+    is_every_second: bool  # second == 63 (component-based only)
+    _recurring_mask: int  # is_every_* combined as _EVERY_* bits
+
+    # Representation (epoch_seconds present), computed once at construction
+    _is_epoch_based: bool
+
+    # Lazily rendered __str__/__repr__ (valid because instances are not modified after construction)
+    _str_cache: str | None
+    _repr_cache: str | None
+
+    # Lazily converted to_datetime() result (valid because instances are not modified after construction)
+    _datetime_cache: datetime | None
+
     def __init__(
         self,
         # Validity
@@ -629,7 +944,7 @@ class TemporalValue(Value):
             is_leap_year: Leap year flag
             daylight_savings_deviation: DST deviation in hours (0-3)
         """
-        super().__init__(is_valid)
+        self.is_valid = is_valid
 
         self.year_2digit = year_2digit
         self.year_full = year_full
@@ -650,83 +965,58 @@ class TemporalValue(Value):
         self.is_leap_year = is_leap_year
         self.daylight_savings_deviation = daylight_savings_deviation
 
+        self._is_epoch_based = epoch_seconds is not None
+
+        self._str_cache = None
+        self._repr_cache = None
+        self._datetime_cache = None
+
+        self.is_every_year = year_2digit == 127
+        self.is_every_month = month == 15
+        self.is_every_day = day == 0
+        self.is_every_hour = hour == 31
+        self.is_every_minute = minute == 63
+        self.is_every_second = second == 63 and not self._is_epoch_based
+
+        self._recurring_mask = (
+            (_EVERY_YEAR if self.is_every_year else 0)
+            | (_EVERY_MONTH if self.is_every_month else 0)
+            | (_EVERY_DAY if self.is_every_day else 0)
+            | (_EVERY_HOUR if self.is_every_hour else 0)
+            | (_EVERY_MINUTE if self.is_every_minute else 0)
+            | (_EVERY_SECOND if self.is_every_second else 0)
+        )
+
     @property
     def is_component_based(self) -> bool:
         """True if using component representation (F, G, I, J)."""
-        return self.epoch_seconds is None
+        return not self._is_epoch_based
 
     @property
     def is_epoch_based(self) -> bool:
         """True if using epoch representation (M)."""
-        return self.epoch_seconds is not None
-
-    @property
-    def is_every_year(self) -> bool:
-        """True if year represents 'every year' recurring pattern."""
-        return self.year_2digit == 127
-
-    @property
-    def is_every_month(self) -> bool:
-        """True if month represents 'every month' recurring pattern."""
-        return self.month == 15
-
-    @property
-    def is_every_day(self) -> bool:
-        """True if day represents 'every day' recurring pattern."""
-        return self.day == 0
-
-    @property
-    def is_every_hour(self) -> bool:
-        """True if hour represents 'every hour' recurring pattern."""
-        return self.hour == 31
-
-    @property
-    def is_every_minute(self) -> bool:
-        """True if minute represents 'every minute' recurring pattern."""
-        return self.minute == 63
-
-    @property
-    def is_every_second(self) -> bool:
-        """True if second represents 'every second' recurring pattern."""
-        if self.is_component_based and self.second is not None:
-            return self.second == 63
-        return False
+        return self._is_epoch_based
 
     @property
     def has_date(self) -> bool:
         """True if any date component is present."""
-        return any(x is not None for x in (self.year_2digit, self.month, self.day))
+        return self.year_2digit is not None or self.month is not None or self.day is not None
 
     @property
     def has_time(self) -> bool:
         """True if any time component is present."""
-        return any(x is not None for x in (self.hour, self.minute, self.second))
+        return self.hour is not None or self.minute is not None or self.second is not None
 
     @property
     def is_fully_specified(self) -> bool:
         """True if valid and no recurring patterns (component-based only)."""
-        if not self.is_valid:
-            return False
-
-        if self.is_epoch_based:
-            return True  # Epoch is always fully specified if valid
-
-        # Check for recurring patterns
-        return not any(
-            [
-                self.is_every_year,
-                self.is_every_month,
-                self.is_every_day,
-                self.is_every_hour,
-                self.is_every_minute,
-                self.is_every_second,
-            ]
-        )
+        # Epoch is always fully specified if valid; components must carry no recurring pattern
+        return self.is_valid and (self._is_epoch_based or self._recurring_mask == 0)
 
     @property
     def is_duration(self) -> bool:
         """True if epoch-based and represents duration (not absolute time)."""
-        return self.is_epoch_based and self.utc_offset_hours == -16
+        return self._is_epoch_based and self.utc_offset_hours == -16
 
     @property
     def starting_epoch(self) -> datetime | None:
@@ -737,14 +1027,25 @@ class TemporalValue(Value):
             datetime(1970, 1, 1, 0, 0, 0, tzinfo=UTC) if epoch_start=1 (Unix epoch)
             None if not epoch-based or invalid epoch_start
         """
-        if not self.is_epoch_based:
+        if not self._is_epoch_based or self.epoch_start not in (0, 1):
             return None
 
-        if self.epoch_start == 0:
-            return datetime(2013, 1, 1, 0, 0, 0, tzinfo=UTC)
-        elif self.epoch_start == 1:
-            return datetime(1970, 1, 1, 0, 0, 0, tzinfo=UTC)
-        return None
+        return _EPOCHS[self.epoch_start]
+
+    @property
+    def _is_epoch_convertible(self) -> bool:
+        """Check the preconditions under which to_datetime() succeeds for an epoch-based value."""
+        utc_offset_hours = self.utc_offset_hours
+        return (
+            self.is_valid
+            and self._is_epoch_based
+            and not self.is_duration
+            and self.epoch_start in (0, 1)
+            and self.epoch_seconds is not None
+            # Whole hours within a day, the offsets timezone() accepts and the UTC{:+d} label can render
+            and isinstance(utc_offset_hours, int)
+            and -24 < utc_offset_hours < 24
+        )
 
     def to_datetime(self) -> datetime:
         """Convert to Python datetime.
@@ -758,22 +1059,32 @@ class TemporalValue(Value):
         Raises:
             ValueError: If not fully specified, invalid, or is duration
         """
+        if self._datetime_cache is None:
+            self._datetime_cache = self._build_datetime()
+        return self._datetime_cache
+
+    def _build_datetime(self) -> datetime:
+        """Build the datetime returned by to_datetime."""
         if not self.is_valid:
             raise ValueError("Cannot convert invalid temporal value")
 
-        if self.is_epoch_based:
+        if self._is_epoch_based:
             if self.is_duration:
                 raise ValueError("Cannot convert duration to datetime")
 
+            starting_epoch = self.starting_epoch
+
             # Type narrowing: these must be non-None for epoch-based
-            if self.starting_epoch is None or self.epoch_seconds is None or self.utc_offset_hours is None:
+            if starting_epoch is None or self.epoch_seconds is None or self.utc_offset_hours is None:
                 raise ValueError("Missing epoch data")
 
             # Calculate absolute time from epoch
-            dt_utc = self.starting_epoch + timedelta(seconds=self.epoch_seconds)
+            dt_utc = starting_epoch + timedelta(seconds=self.epoch_seconds)
 
             # Apply timezone offset
-            offset = timezone(timedelta(hours=self.utc_offset_hours))
+            offset = _UTC_OFFSET_TIMEZONES.get(self.utc_offset_hours)
+            if offset is None:
+                offset = timezone(timedelta(hours=self.utc_offset_hours))
             return dt_utc.astimezone(offset)
 
         else:  # Component-based
@@ -789,15 +1100,12 @@ class TemporalValue(Value):
             if self.hour is None or self.minute is None:
                 raise ValueError("Missing time components")
 
-            return datetime(
-                self.year_full,
-                self.month,
-                self.day,
-                self.hour,
-                self.minute,
-                int(self.second) if self.second is not None else 0,
-                int((self.second % 1) * 1_000_000) if self.second is not None else 0,
-            )
+            # Split fractional seconds once: subtracting the whole part avoids a float modulo
+            second = self.second
+            whole_second = 0 if second is None else int(second)
+            microsecond = 0 if second is None else int((second - whole_second) * 1_000_000)
+
+            return datetime(self.year_full, self.month, self.day, self.hour, self.minute, whole_second, microsecond)
 
     def to_date(self) -> date:
         """Convert to Python date (component-based only).
@@ -808,7 +1116,7 @@ class TemporalValue(Value):
         Raises:
             ValueError: If not component-based, not fully specified, or missing date
         """
-        if not self.is_component_based:
+        if self._is_epoch_based:
             raise ValueError("Cannot convert epoch-based to date")
 
         if not self.is_fully_specified or not self.has_date:
@@ -829,7 +1137,7 @@ class TemporalValue(Value):
         Raises:
             ValueError: If not component-based, not fully specified, or missing time
         """
-        if not self.is_component_based:
+        if self._is_epoch_based:
             raise ValueError("Cannot convert epoch-based to time")
 
         if not self.is_fully_specified or not self.has_time:
@@ -839,12 +1147,12 @@ class TemporalValue(Value):
         if self.hour is None or self.minute is None:
             raise ValueError("Missing time components")
 
-        return time(
-            self.hour,
-            self.minute,
-            int(self.second) if self.second is not None else 0,
-            int((self.second % 1) * 1_000_000) if self.second is not None else 0,
-        )
+        # Split fractional seconds once: subtracting the whole part avoids a float modulo
+        second = self.second
+        whole_second = 0 if second is None else int(second)
+        microsecond = 0 if second is None else int((second - whole_second) * 1_000_000)
+
+        return time(self.hour, self.minute, whole_second, microsecond)
 
     def to_timedelta(self) -> timedelta:
         """Convert to Python timedelta.
@@ -857,17 +1165,15 @@ class TemporalValue(Value):
         Raises:
             ValueError: If not epoch-based or not duration
         """
-        if not self.is_epoch_based:
-            raise ValueError("Cannot convert component-based to timedelta")
+        epoch_seconds = self.epoch_seconds
 
-        if not self.is_duration:
+        # epoch_seconds is set exactly when epoch-based, so one check covers both preconditions
+        if epoch_seconds is None or self.utc_offset_hours != -16:
+            if epoch_seconds is None:
+                raise ValueError("Cannot convert component-based to timedelta")
             raise ValueError("Cannot convert absolute time to timedelta (use is_duration)")
 
-        # Type narrowing: epoch_seconds must be non-None
-        if self.epoch_seconds is None:
-            raise ValueError("Missing epoch_seconds")
-
-        return timedelta(seconds=self.epoch_seconds)
+        return timedelta(seconds=epoch_seconds)
 
     def __str__(self) -> str:
         """Human-readable representation.
@@ -885,53 +1191,95 @@ class TemporalValue(Value):
             "Duration: 3600.0s (res=1.0s)" - Type M duration
             "2025-03-15 14:30:00+01:00 (UTC+1, res=1.0s)" - Type M absolute time
         """
-        if self.is_epoch_based:
+        if self._str_cache is None:
+            self._str_cache = self._format_str()
+        return self._str_cache
+
+    def __repr__(self) -> str:
+        """Developer representation showing all fields."""
+        if self._repr_cache is None:
+            self._repr_cache = self._format_repr()
+        return self._repr_cache
+
+    def _format_str(self) -> str:
+        """Render the human-readable representation returned by __str__."""
+        if self._is_epoch_based:
             if self.is_duration:
-                return f"Duration: {self.epoch_seconds}s (res={self.resolution_seconds}s)"
+                return _DURATION_FORMAT % (self.epoch_seconds, self.resolution_seconds)
             else:
-                try:
-                    dt = self.to_datetime()
-                    return f"{dt.isoformat()} (UTC{self.utc_offset_hours:+d}, res={self.resolution_seconds}s)"
-                except (ValueError, TypeError):
+                if not self._is_epoch_convertible:
                     return "<invalid epoch time>"
+                return _EPOCH_FORMAT % (self.to_datetime().isoformat(), self.utc_offset_hours, self.resolution_seconds)
 
         else:  # Component-based
-            parts = []
-
-            if self.has_date:
-                year_str = "*" if self.is_every_year else (str(self.year_full) if self.year_full is not None else "?")
-                month_str = "*" if self.is_every_month else (f"{self.month:02d}" if self.month is not None else "?")
-                day_str = "*" if self.is_every_day else (f"{self.day:02d}" if self.day is not None else "?")
-                parts.append(f"{year_str}-{month_str}-{day_str}")
-
-            if self.has_time:
-                hour_str = "*" if self.is_every_hour else (f"{self.hour:02d}" if self.hour is not None else "?")
-                minute_str = "*" if self.is_every_minute else (f"{self.minute:02d}" if self.minute is not None else "?")
-
-                if self.second is not None:
-                    if self.is_every_second:
-                        second_str = "*"
-                    else:
-                        # Handle fractional seconds
-                        second_str = f"{self.second:06.3f}" if self.second % 1 else f"{int(self.second):02d}"
-                    parts.append(f"{hour_str}:{minute_str}:{second_str}")
-                else:
-                    parts.append(f"{hour_str}:{minute_str}")
-
-            return " ".join(parts) if parts else "<empty>"
-
-    def __repr__(self) -> str:
-        """Developer representation showing all fields."""
-        if self.is_epoch_based:
-            return (
-                f"ValueTemporal(epoch_seconds={self.epoch_seconds}, "
-                f"utc_offset_hours={self.utc_offset_hours}, "
-                f"resolution_seconds={self.resolution_seconds}, "
-                f"epoch_start={self.epoch_start}, is_valid={self.is_valid})"
+            # Each component is read several times below, so bind them to locals once
+            year_full, month, day = self.year_full, self.month, self.day
+            hour, minute, second = self.hour, self.minute, self.second
+
+            # Fast path: fully specified date and time with whole seconds is rendered by the C isoformat.
+            # isoformat zero-pads the year to four digits, so only four-digit years take this path.
+            if (
+                self._recurring_mask == 0
+                and year_full is not None
+                and 1000 <= year_full <= 9999
+                and month is not None
+                and day is not None
+                and hour is not None
+                and minute is not None
+                and second is not None
+                and second.is_integer()
+            ):
+                try:
+                    return datetime(year_full, month, day, hour, minute, int(second)).isoformat(sep=" ")
+                except ValueError:
+                    pass  # Out-of-range component (e.g. Feb 31): render it piecewise below
+
+            # Fast path: date and HH:MM without seconds or recurring patterns (Type F)
+            if (
+                self._recurring_mask == 0
+                and second is None
+                and year_full is not None
+                and month is not None
+                and day is not None
+                and hour is not None
+                and minute is not None
+            ):
+                return _DATE_HOUR_MINUTE_FORMAT % (
+                    _YEAR_STR.get(year_full) or str(year_full),
+                    _two_digit(month),
+                    _two_digit(day),
+                    _two_digit(hour),
+                    _two_digit(minute),
+                )
+
+            # Periodic readings repeat the same few patterns, so the rendered parts are memoized
+            recurring_mask = self._recurring_mask
+            date_str = _format_date(recurring_mask, year_full, month, day) if self.has_date else None
+            time_str = _format_time(recurring_mask, hour, minute, second) if self.has_time else None
+
+            # At most two parts, so concatenate directly rather than building a list to join
+            if date_str is not None and time_str is not None:
+                return date_str + " " + time_str
+            return date_str or time_str or "<empty>"
+
+    def _format_repr(self) -> str:
+        """Render the developer representation returned by __repr__."""
+        if self._is_epoch_based:
+            return _EPOCH_REPR_FORMAT % (
+                self.epoch_seconds,
+                self.utc_offset_hours,
+                self.resolution_seconds,
+                self.epoch_start,
+                self.is_valid,
             )
         else:
-            return (
-                f"ValueTemporal(year_2digit={self.year_2digit}, year_full={self.year_full}, "
-                f"month={self.month}, day={self.day}, hour={self.hour}, "
-                f"minute={self.minute}, second={self.second}, is_valid={self.is_valid})"
+            return _COMPONENT_REPR_FORMAT % (
+                self.year_2digit,
+                self.year_full,
+                self.month,
+                self.day,
+                self.hour,
+                self.minute,
+                self.second,
+                self.is_valid,
             )
@@ -13,7 +13,6 @@ Reference: EN 13757-3:2018, Tables 10-16
 
 from __future__ import annotations
 
-from abc import ABC
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from functools import lru_cache
@@ -44,8 +43,8 @@ VIF_EXTENSION_BIT_MASK = 0b10000000  # Bit 7: extension bit (more VIFE bytes fol
 # =============================================================================
 
 
-@dataclass(frozen=True, kw_only=True)
-class _AbstractFieldDescriptor(ABC):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _AbstractFieldDescriptor:
     """Base class for VIF/VIFE field descriptors.
 
     Field descriptors contain metadata for VIF/VIFE codes, including the code value,
@@ -58,7 +57,7 @@ class _AbstractFieldDescriptor(ABC):
     direction: CommunicationDirection = CommunicationDirection.BIDIRECTIONAL
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class _TrueFieldDescriptor(_AbstractFieldDescriptor):
     """Descriptor for VIF/VIFE codes that define unit and value semantics.
 
@@ -75,7 +74,7 @@ class _TrueFieldDescriptor(_AbstractFieldDescriptor):
     value_transformer: ValueTransformer | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class _PlainTextFieldDescriptor(_TrueFieldDescriptor):
     """Descriptor for plain text VIF (code 0x7C).
 
@@ -83,7 +82,7 @@ class _PlainTextFieldDescriptor(_TrueFieldDescriptor):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class _ManufacturerFieldDescriptor(_AbstractFieldDescriptor):
     """Descriptor for manufacturer-specific VIF/VIFE (code 0x7F/0xFF).
 
@@ -91,7 +90,7 @@ class _ManufacturerFieldDescriptor(_AbstractFieldDescriptor):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class _ReadoutAnyFieldDescriptor(_AbstractFieldDescriptor):
     """Descriptor for global readout request VIF (code 0x7E).
 
@@ -99,7 +98,7 @@ class _ReadoutAnyFieldDescriptor(_AbstractFieldDescriptor):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class _CombinableFieldDescriptor(_AbstractFieldDescriptor):
     """Descriptor for combinable (orthogonal) VIFE codes.
 
@@ -116,7 +115,7 @@ class _CombinableFieldDescriptor(_AbstractFieldDescriptor):
     value_transformer: ValueTransformer | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class _ActionFieldDescriptor(_AbstractFieldDescriptor):
     """Descriptor for object action VIFE codes (master to slave).
 
@@ -128,7 +127,7 @@ class _ActionFieldDescriptor(_AbstractFieldDescriptor):
     action: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class _ErrorFieldDescriptor(_AbstractFieldDescriptor):
     """Descriptor for record error VIFE codes (slave to master).
 
@@ -142,7 +141,7 @@ class _ErrorFieldDescriptor(_AbstractFieldDescriptor):
     error_group: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class _ExtensionFieldDescriptor(_AbstractFieldDescriptor):
     """Descriptor for VIF/VIFE codes that point to extension tables.
 
@@ -1808,7 +1807,6 @@ _PrimaryFieldTable: tuple[_AbstractFieldDescriptor, ...] = (
 # =============================================================================
 
 
-@lru_cache(maxsize=128)
 def _find_field_descriptor(
     direction: CommunicationDirection,
     field_code: int,
@@ -1816,6 +1814,9 @@ def _find_field_descriptor(
 ) -> _AbstractFieldDescriptor:
     """Find the matching field descriptor for a VIF/VIFE field code.
 
+    Plain linear scan, the fallback for tables without a precomputed lookup.
+    Not cached: the key would hash the whole table on every call.
+
     Args:
         direction: Communication direction (MASTER_TO_SLAVE or SLAVE_TO_MASTER)
         field_code: The VIF/VIFE byte value (0x00-0xFF)
@@ -1834,11 +1835,98 @@ def _find_field_descriptor(
     raise ValueError(f"VIF/VIFE code 0x{field_code:02X} for direction {direction.name} not found in VIF/VIFE tables")
 
 
+def _build_field_lookup(
+    field_table: tuple[_AbstractFieldDescriptor, ...],
+) -> dict[CommunicationDirection, tuple[_AbstractFieldDescriptor | None, ...]]:
+    """Precompute the matching descriptor for every byte value of a VIF/VIFE table.
+
+    Args:
+        field_table: The table to expand
+
+    Returns:
+        Per direction, a 256-entry tuple indexed by field code holding the first
+        matching descriptor (same match rule as _find_field_descriptor) or None
+    """
+    return {
+        direction: tuple(
+            next(
+                (
+                    field_descriptor
+                    for field_descriptor in field_table
+                    if direction in field_descriptor.direction
+                    and (field_code & field_descriptor.mask) == field_descriptor.code
+                ),
+                None,
+            )
+            for field_code in range(256)
+        )
+        for direction in (
+            CommunicationDirection.MASTER_TO_SLAVE,
+            CommunicationDirection.SLAVE_TO_MASTER,
+            CommunicationDirection.BIDIRECTIONAL,
+        )
+    }
+
+
+# Every byte of every VIF/VIFE table resolved once at import time, keyed by table identity
+# (hashing a table tuple would hash all of its descriptors on every lookup)
+_FIELD_LOOKUPS = {
+    id(field_table): _build_field_lookup(field_table)
+    for field_table in (
+        _PrimaryFieldTable,
+        _FirstExtensionFieldTable,
+        _SecondExtensionFieldTable,
+        _SecondExtensionSecondLevelFieldTable,
+        _CombinableOrthogonalFieldTable,
+        _CombinableExtensionFieldTable,
+    )
+}
+
+
+def _lookup_field_descriptor(
+    direction: CommunicationDirection,
+    field_code: int,
+    field_table: tuple[_AbstractFieldDescriptor, ...],
+) -> _AbstractFieldDescriptor:
+    """Find the field descriptor for a VIF/VIFE byte in the precomputed table lookups.
+
+    Tables without a precomputed lookup, and codes outside 0x00-0xFF, fall back
+    to _find_field_descriptor.
+
+    Args:
+        direction: Communication direction (MASTER_TO_SLAVE or SLAVE_TO_MASTER)
+        field_code: The VIF/VIFE byte value (0x00-0xFF)
+        field_table: The table to search in
+
+    Returns:
+        The matching field descriptor
+
+    Raises:
+        ValueError: If no matching descriptor is found in the table
+    """
+    field_lookup = _FIELD_LOOKUPS.get(id(field_table))
+
+    # The lookups only cover byte values; the scan masks any other code like before
+    if field_lookup is None or not 0 <= field_code <= 0xFF:
+        return _find_field_descriptor(direction, field_code, field_table)
+
+    field_descriptor = field_lookup[direction][field_code]
+
+    if field_descriptor is None:
+        raise ValueError(
+            f"VIF/VIFE code 0x{field_code:02X} for direction {direction.name} not found in VIF/VIFE tables"
+        )
+
+    return field_descriptor
+
+
+@lru_cache(maxsize=256)
 def _decode_ascii_unit(data: bytes) -> str:
     """Decode reversed ASCII text string (Plain Text VIF format).
 
     Decodes ASCII text that is transmitted with the rightmost character first,
-    as specified for Plain Text VIF (VIF=7Ch/FCh) in M-Bus.
+    as specified for Plain Text VIF (VIF=7Ch/FCh) in M-Bus. Cached, as meters
+    repeat a small vocabulary of plain text units.
 
     Reference: EN 13757-3:2018, Annex C.2 (Plain text units)
 
@@ -1851,14 +1939,16 @@ def _decode_ascii_unit(data: bytes) -> str:
     Raises:
         UnicodeDecodeError: If data contains non-ASCII bytes (≥ 0x80)
     """
-    return bytes(reversed(data)).decode("ascii")
+    return data[::-1].decode("ascii")
 
 
+@lru_cache(maxsize=256)
 def _encode_ascii_unit(text: str) -> tuple[int, ...]:
     """Encode text string to reversed ASCII bytes (Plain Text VIF format).
 
     Encodes ASCII text for transmission with the rightmost character first,
-    as specified for Plain Text VIF (VIF=7Ch/FCh) in M-Bus.
+    as specified for Plain Text VIF (VIF=7Ch/FCh) in M-Bus. Cached, as meters
+    repeat a small vocabulary of plain text units.
 
     Reference: EN 13757-3:2018, Annex C.2 (Plain text units)
 
@@ -1871,7 +1961,7 @@ def _encode_ascii_unit(text: str) -> tuple[int, ...]:
     Raises:
         UnicodeEncodeError: If text contains non-ASCII characters
     """
-    return tuple(reversed(text.encode("ascii")))
+    return tuple(text.encode("ascii")[::-1])
 
 
 # =============================================================================
@@ -1903,6 +1993,9 @@ class VIF:
 
     _field_code: int
 
+    # Set by __new__/VIFE.__new__ (None for ManufacturerVIFE, which has no table)
+    _field_descriptor: _AbstractFieldDescriptor | None = None
+
     direction: CommunicationDirection
 
     _chain_position: int = 0
@@ -1914,24 +2007,33 @@ class VIF:
     _next_table: tuple[_AbstractFieldDescriptor, ...] | None = None
 
     def __new__(cls, direction: CommunicationDirection, field_code: int) -> VIF:
-        field_descriptor = _find_field_descriptor(direction, field_code, _PrimaryFieldTable)
+        field_descriptor = _lookup_field_descriptor(direction, field_code, _PrimaryFieldTable)
+
+        vif: VIF
 
         if isinstance(field_descriptor, _TrueFieldDescriptor):
             if isinstance(field_descriptor, _PlainTextFieldDescriptor):
-                return object.__new__(PlainTextVIF)
-            return object.__new__(TrueVIF)
+                vif = object.__new__(PlainTextVIF)
+            else:
+                vif = object.__new__(TrueVIF)
+
+        elif isinstance(field_descriptor, _ExtensionFieldDescriptor):
+            vif = object.__new__(ExtensionVIF)
 
-        if isinstance(field_descriptor, _ExtensionFieldDescriptor):
-            return object.__new__(ExtensionVIF)
+        elif isinstance(field_descriptor, _ManufacturerFieldDescriptor):
+            vif = object.__new__(ManufacturerVIF)
 
-        if isinstance(field_descriptor, _ManufacturerFieldDescriptor):
-            return object.__new__(ManufacturerVIF)
+        elif isinstance(field_descriptor, _ReadoutAnyFieldDescriptor):
+            vif = object.__new__(ReadoutAnyVIF)
 
-        if isinstance(field_descriptor, _ReadoutAnyFieldDescriptor):
-            return object.__new__(ReadoutAnyVIF)
+        else:
+            # Should never reach here - field descriptor can only be one of the above types
+            raise AssertionError(f"Field descriptor type {type(field_descriptor).__name__} not recognized")
 
-        # Should never reach here - field descriptor can only be one of the above types
-        raise AssertionError(f"Field descriptor type {type(field_descriptor).__name__} not recognized")
+        # Hand the descriptor to the subclass __init__ so it is looked up only once
+        vif._field_descriptor = field_descriptor
+
+        return vif
 
     def __init__(self, direction: CommunicationDirection, field_code: int) -> None:
         if direction is CommunicationDirection.BIDIRECTIONAL:
@@ -2038,7 +2140,7 @@ class TrueVIF(VIF):
     def __init__(self, direction: CommunicationDirection, field_code: int) -> None:
         super().__init__(direction, field_code)
 
-        field_descriptor = _find_field_descriptor(direction, field_code, _PrimaryFieldTable)
+        field_descriptor = self._field_descriptor
 
         # VIF.__new__ guarantees descriptor is _TrueFieldDescriptor
         assert isinstance(field_descriptor, _TrueFieldDescriptor), (
@@ -2072,7 +2174,7 @@ class ExtensionVIF(VIF):
         # ExtensionVIF cannot be the last field
         assert self.last_field is False, "ExtensionVIF cannot be the last field"
 
-        field_descriptor = _find_field_descriptor(direction, field_code, _PrimaryFieldTable)
+        field_descriptor = self._field_descriptor
 
         # VIF.__new__ guarantees descriptor is _ExtensionFieldDescriptor
         assert isinstance(field_descriptor, _ExtensionFieldDescriptor), (
@@ -2096,7 +2198,7 @@ class PlainTextVIF(TrueVIF):
     def __init__(self, direction: CommunicationDirection, field_code: int) -> None:
         super().__init__(direction, field_code)
 
-        field_descriptor = _find_field_descriptor(direction, field_code, _PrimaryFieldTable)
+        field_descriptor = self._field_descriptor
 
         # VIF.__new__ guarantees descriptor is _PlainTextFieldDescriptor
         assert isinstance(field_descriptor, _PlainTextFieldDescriptor), (
@@ -2193,7 +2295,7 @@ class ReadoutAnyVIF(VIF):
     def __init__(self, direction: CommunicationDirection, field_code: int) -> None:
         super().__init__(direction, field_code)
 
-        field_descriptor = _find_field_descriptor(direction, field_code, _PrimaryFieldTable)
+        field_descriptor = self._field_descriptor
 
         # VIF.__new__ guarantees descriptor is _ReadoutAnyFieldDescriptor
         assert isinstance(field_descriptor, _ReadoutAnyFieldDescriptor), (
@@ -2215,7 +2317,7 @@ class ManufacturerVIF(VIF):
     def __init__(self, direction: CommunicationDirection, field_code: int) -> None:
         super().__init__(direction, field_code)
 
-        field_descriptor = _find_field_descriptor(direction, field_code, _PrimaryFieldTable)
+        field_descriptor = self._field_descriptor
 
         # VIF.__new__ guarantees descriptor is _ManufacturerFieldDescriptor
         assert isinstance(field_descriptor, _ManufacturerFieldDescriptor), (
@@ -2243,38 +2345,50 @@ class VIFE(VIF):
         if isinstance(prev_field, (ManufacturerVIF, ManufacturerVIFE)):
             return object.__new__(ManufacturerVIFE)
 
-        field_descriptor = _find_field_descriptor(direction, field_code, prev_field._next_table)
+        assert prev_field._next_table is not None, "Previous field has no next table defined"
+
+        field_descriptor = _lookup_field_descriptor(direction, field_code, prev_field._next_table)
+
+        vife_class: type[VIFE] | None = None
 
         if isinstance(prev_field, ExtensionCombinableVIFE):
             if isinstance(field_descriptor, _CombinableFieldDescriptor):
-                return object.__new__(CombinableVIFE)
+                vife_class = CombinableVIFE
 
         elif isinstance(prev_field, ExtensionVIF):
             if isinstance(field_descriptor, _TrueFieldDescriptor):
-                return object.__new__(TrueVIFE)
+                vife_class = TrueVIFE
             elif isinstance(field_descriptor, _ExtensionFieldDescriptor):
-                return object.__new__(ExtensionVIFE)
+                vife_class = ExtensionVIFE
 
         elif isinstance(prev_field, ExtensionVIFE):
             if isinstance(field_descriptor, _TrueFieldDescriptor):
-                return object.__new__(TrueVIFE)
+                vife_class = TrueVIFE
 
         else:
             if isinstance(field_descriptor, _CombinableFieldDescriptor):
-                return object.__new__(CombinableVIFE)
+                vife_class = CombinableVIFE
             elif isinstance(field_descriptor, _ExtensionFieldDescriptor):
-                return object.__new__(ExtensionCombinableVIFE)
+                vife_class = ExtensionCombinableVIFE
             elif isinstance(field_descriptor, _ActionFieldDescriptor):
-                return object.__new__(ActionVIFE)
+                vife_class = ActionVIFE
             elif isinstance(field_descriptor, _ErrorFieldDescriptor):
-                return object.__new__(ErrorVIFE)
+                vife_class = ErrorVIFE
             elif isinstance(field_descriptor, _ManufacturerFieldDescriptor):
-                return object.__new__(ManufacturerVIFE)
+                vife_class = ManufacturerVIFE
 
-        # Should never reach here - invalid VIFE chain
-        raise AssertionError(
-            f"Field descriptor type {type(field_descriptor).__name__} not recognized for VIFE after {type(prev_field).__name__}"
-        )
+        if vife_class is None:
+            # Should never reach here - invalid VIFE chain
+            raise AssertionError(
+                f"Field descriptor type {type(field_descriptor).__name__} not recognized for VIFE after {type(prev_field).__name__}"
+            )
+
+        vife = object.__new__(vife_class)
+
+        # Hand the descriptor to the subclass __init__ so it is looked up only once
+        vife._field_descriptor = field_descriptor
+
+        return vife
 
     def __init__(self, direction: CommunicationDirection, field_code: int, prev_field: VIF | VIFE) -> None:
         if prev_field.last_field:
@@ -2327,10 +2441,7 @@ class TrueVIFE(VIFE):
             f"TrueVIFE cannot follow {type(self.prev_field).__name__}"
         )
 
-        # Previous field always has a next table defined at this point
-        assert self.prev_field._next_table is not None, "Previous field has no next table defined"
-
-        field_descriptor = _find_field_descriptor(direction, field_code, self.prev_field._next_table)
+        field_descriptor = self._field_descriptor
 
         # VIFE.__new__ guarantees descriptor is _TrueFieldDescriptor
         assert isinstance(field_descriptor, _TrueFieldDescriptor), (
@@ -2368,10 +2479,7 @@ class ExtensionVIFE(VIFE):
             f"ExtensionVIFE cannot follow {type(self.prev_field).__name__}"
         )
 
-        # Previous field always has a next table defined at this point
-        assert self.prev_field._next_table is not None, "Previous field has no next table defined"
-
-        field_descriptor = _find_field_descriptor(direction, field_code, self.prev_field._next_table)
+        field_descriptor = self._field_descriptor
 
         # VIFE.__new__ guarantees descriptor is _ExtensionFieldDescriptor
         assert isinstance(field_descriptor, _ExtensionFieldDescriptor), (
@@ -2429,10 +2537,7 @@ class CombinableVIFE(VIFE):
             ),
         ), f"CombinableVIFE cannot follow {type(self.prev_field).__name__}"
 
-        # Previous field always has a next table defined at this point
-        assert self.prev_field._next_table is not None, "Previous field has no next table defined"
-
-        field_descriptor = _find_field_descriptor(direction, field_code, self.prev_field._next_table)
+        field_descriptor = self._field_descriptor
 
         # VIFE.__new__ guarantees descriptor is _CombinableFieldDescriptor
         assert isinstance(field_descriptor, _CombinableFieldDescriptor), (
@@ -2472,10 +2577,7 @@ class ExtensionCombinableVIFE(VIFE):
             f"ExtensionCombinableVIFE cannot follow {type(self.prev_field).__name__}"
         )
 
-        # Previous field always has a next table defined at this point
-        assert self.prev_field._next_table is not None, "Previous field has no next table defined"
-
-        field_descriptor = _find_field_descriptor(direction, field_code, self.prev_field._next_table)
+        field_descriptor = self._field_descriptor
 
         # VIFE.__new__ guarantees descriptor is _ExtensionFieldDescriptor
         assert isinstance(field_descriptor, _ExtensionFieldDescriptor), (
@@ -2514,10 +2616,7 @@ class ActionVIFE(VIFE):
             f"ActionVIFE cannot follow {type(self.prev_field).__name__}"
         )
 
-        # Previous field always has a next table defined at this point
-        assert self.prev_field._next_table is not None, "Previous field has no next table defined"
-
-        field_descriptor = _find_field_descriptor(direction, field_code, self.prev_field._next_table)
+        field_descriptor = self._field_descriptor
 
         # VIFE.__new__ guarantees descriptor is _ActionFieldDescriptor
         assert isinstance(field_descriptor, _ActionFieldDescriptor), (
@@ -2561,10 +2660,7 @@ class ErrorVIFE(VIFE):
             f"ErrorVIFE cannot follow {type(self.prev_field).__name__}"
         )
 
-        # Previous field always has a next table defined at this point
-        assert self.prev_field._next_table is not None, "Previous field has no next table defined"
-
-        field_descriptor = _find_field_descriptor(direction, field_code, self.prev_field._next_table)
+        field_descriptor = self._field_descriptor
 
         # VIFE.__new__ guarantees descriptor is _ErrorFieldDescriptor
         assert isinstance(field_descriptor, _ErrorFieldDescriptor), (
@@ -0,0 +1,491 @@
+"""Unit tests for value transformers and value classes."""
+
+import copy
+import pickle
+from collections.abc import Callable
+from datetime import UTC, datetime, time, timedelta, timezone
+
+import pytest
+
+from src.mbusmaster.protocol.value import (
+    BooleanArrayValue,
+    FloatValue,
+    IntegerValue,
+    StringValue,
+    TemporalValue,
+    ValueDescriptionTransformer,
+    ValueTransformer,
+    ValueUnitTransformer,
+)
+
+# =============================================================================
+# ValueTransformer Tests
+# =============================================================================
+
+
+class TestValueTransformer:
+    """Tests for ValueTransformer precomputed scale/offset table."""
+
+    @pytest.mark.parametrize(
+        ("transformer", "value", "code", "expected"),
+        [
+            (ValueTransformer.MULT_10_POW_NNN_MINUS_3, 1042, 0x03, 1042.0),
+            (ValueTransformer.MULT_10_POW_NNN_MINUS_3, 1042, 0x00, 1.042),
+            (ValueTransformer.MULT_10_POW_NNN, 5, 0x07, 50_000_000.0),
+            (ValueTransformer.MULT_10_POW_NN_PLUS_5, 2, 0x01, 2_000_000.0),
+            (ValueTransformer.MULT_10_POW_N_MINUS_1, 7, 0x00, 0.7),
+            (ValueTransformer.MULT_10_POW_NNNN_MINUS_12, 3, 0x0F, 3000.0),
+            (ValueTransformer.MULT_10_POW_NNN_MINUS_7_DIV_60, 60, 0x07, 1.0),
+            (ValueTransformer.MULT_10_POW_NNN_MINUS_3_DIV_3600, 3600, 0x03, 1.0),
+            (ValueTransformer.MULT_2_POW_MINUS_12, 4096, 0x00, 1.0),
+            (ValueTransformer.MULT_1000, 2, 0xFF, 2000.0),
+            (ValueTransformer.MULT_0_1, 10, 0x00, 1.0),
+            (ValueTransformer.ADD_10_POW_NN_MINUS_3, 5, 0x01, 5.01),
+        ],
+        ids=[
+            "nnn_minus_3_unit",
+            "nnn_minus_3_milli",
+            "nnn_max",
+            "nn_plus_5",
+            "n_minus_1",
+            "nnnn_minus_12",
+            "div_60",
+            "div_3600",
+            "pow_2_minus_12",
+            "fixed_1000",
+            "fixed_0_1",
+            "additive",
+        ],
+    )
+    def test_transform(self, transformer: ValueTransformer, value: float, code: int, expected: float) -> None:
+        """Test that each transformer applies the scale/offset selected by the code bits."""
+        result = transformer(value, code)
+        assert isinstance(result, float)
+        assert result == pytest.approx(expected)
+
+    def test_upper_code_bits_are_ignored(self) -> None:
+        """Test that bits outside the transformer mask do not change the result."""
+        assert ValueTransformer.MULT_10_POW_NNN_MINUS_3(1, 0x03) == ValueTransformer.MULT_10_POW_NNN_MINUS_3(1, 0xFB)
+
+    def test_division_matches_formula_exactly(self) -> None:
+        """Test that the time conversions divide rather than multiply by a folded reciprocal."""
+        assert ValueTransformer.MULT_10_POW_NNN_MINUS_6_DIV_3600(15, 0x00) == 15 * 10**-6 / 3600
+
+    def test_members_are_not_ints(self) -> None:
+        """Test that members do not compare equal to their table index."""
+        assert ValueTransformer.MULT_10_POW_NNN_MINUS_3 != 0
+
+
+class TestValueUnitTransformer:
+    """Tests for ValueUnitTransformer."""
+
+    @pytest.mark.parametrize(
+        ("unit", "expected"),
+        [("m³", "ft³"), ("kg", "kg")],
+        ids=["cubic_meter", "unchanged"],
+    )
+    def test_metric_to_imperial(self, unit: str, expected: str) -> None:
+        """Test that METRIC_TO_IMPERIAL converts volume units only."""
+        assert ValueUnitTransformer.METRIC_TO_IMPERIAL(unit, 0x00) == expected
+
+
+class TestValueDescriptionTransformer:
+    """Tests for ValueDescriptionTransformer."""
+
+    def test_append_per_second(self) -> None:
+        """Test that APPEND_PER_SECOND appends the rate suffix."""
+        assert ValueDescriptionTransformer.APPEND_PER_SECOND("Volume", 0x00) == "Volume per second"
+
+
+# =============================================================================
+# TemporalValue Tests
+# =============================================================================
+
+
+class TestTemporalValueRecurring:
+    """Tests for TemporalValue recurring pattern flags."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "flag"),
+        [
+            ({"year_2digit": 127, "month": 3, "day": 15}, "is_every_year"),
+            ({"year_2digit": 25, "month": 15, "day": 15}, "is_every_month"),
+            ({"year_2digit": 25, "month": 3, "day": 0}, "is_every_day"),
+            ({"hour": 31, "minute": 30}, "is_every_hour"),
+            ({"hour": 14, "minute": 63}, "is_every_minute"),
+            ({"hour": 14, "minute": 30, "second": 63}, "is_every_second"),
+        ],
+        ids=["year", "month", "day", "hour", "minute", "second"],
+    )
+    def test_single_recurring_flag(self, kwargs: dict[str, int], flag: str) -> None:
+        """Test that exactly one recurring flag is set and value is not fully specified."""
+        value = TemporalValue(True, **kwargs)
+        flags = [
+            "is_every_year",
+            "is_every_month",
+            "is_every_day",
+            "is_every_hour",
+            "is_every_minute",
+            "is_every_second",
+        ]
+        assert [getattr(value, name) for name in flags] == [name == flag for name in flags]
+        assert not value.is_fully_specified
+
+    def test_fully_specified(self) -> None:
+        """Test that a value without recurring patterns is fully specified."""
+        value = TemporalValue(True, year_2digit=25, year_full=2025, month=3, day=15, hour=14, minute=30, second=0)
+        assert value.is_fully_specified
+
+    def test_invalid_is_not_fully_specified(self) -> None:
+        """Test that an invalid value is never fully specified."""
+        assert not TemporalValue(False, year_2digit=25, month=3, day=15).is_fully_specified
+
+    def test_epoch_based_second_is_not_recurring(self) -> None:
+        """Test that second=63 does not mark an epoch-based value as recurring."""
+        value = TemporalValue(True, second=63, epoch_seconds=0.0, utc_offset_hours=0, epoch_start=1)
+        assert not value.is_every_second
+        assert value.is_fully_specified
+
+
+class TestSlots:
+    """Tests that value containers do not carry a per-instance __dict__."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            TemporalValue(True, hour=14, minute=30),
+            BooleanArrayValue(True, 0b01, 2),
+            FloatValue(True, 1.5),
+            StringValue(True, "abc"),
+        ],
+        ids=["temporal", "boolean_array", "float", "string"],
+    )
+    def test_no_instance_dict(self, value: object) -> None:
+        """Test that instances use __slots__ instead of __dict__."""
+        assert not hasattr(value, "__dict__")
+
+
+class TestBuiltinValues:
+    """Tests for int/float/str backed value classes."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected", "expected_valid"),
+        [
+            (IntegerValue(True, 42), 42, True),
+            (IntegerValue(False), 0, False),
+            (FloatValue(True, 1.5), 1.5, True),
+            (StringValue(True, "abc"), "abc", True),
+        ],
+        ids=["integer", "integer_invalid", "float", "string"],
+    )
+    def test_value_and_validity(
+        self, value: IntegerValue | FloatValue | StringValue, expected: object, expected_valid: bool
+    ) -> None:
+        """Test that the builtin value and is_valid flag are both set by construction."""
+        assert value == expected
+        assert value.is_valid is expected_valid
+
+
+class TestTemporalValueComponents:
+    """Tests for TemporalValue date/time presence checks."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_date", "expected_time"),
+        [
+            ({"year_2digit": 25, "month": 3, "day": 15}, True, False),
+            ({"day": 15}, True, False),
+            ({"hour": 14, "minute": 30, "second": 0}, False, True),
+            ({"second": 0}, False, True),
+            ({"month": 3, "minute": 30}, True, True),
+            ({}, False, False),
+        ],
+        ids=["date", "day_only", "time", "second_only", "both", "empty"],
+    )
+    def test_has_date_has_time(self, kwargs: dict[str, int], expected_date: bool, expected_time: bool) -> None:
+        """Test that has_date/has_time detect any present component."""
+        value = TemporalValue(True, **kwargs)
+        assert value.has_date is expected_date
+        assert value.has_time is expected_time
+
+
+class TestTemporalValueEpoch:
+    """Tests for epoch-based (Type M) TemporalValue conversions."""
+
+    @pytest.mark.parametrize(
+        ("epoch_start", "expected"),
+        [
+            (0, datetime(2013, 1, 1, tzinfo=UTC)),
+            (1, datetime(1970, 1, 1, tzinfo=UTC)),
+            (2, None),
+        ],
+        ids=["2013", "unix", "unknown"],
+    )
+    def test_starting_epoch(self, epoch_start: int, expected: datetime | None) -> None:
+        """Test that starting_epoch maps epoch_start to the shared epoch constants."""
+        value = TemporalValue(True, epoch_seconds=0.0, utc_offset_hours=0, epoch_start=epoch_start)
+        assert value.starting_epoch == expected
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_epoch"),
+        [({"epoch_seconds": 0.0, "epoch_start": 1}, True), ({"hour": 1, "minute": 2}, False)],
+        ids=["epoch", "component"],
+    )
+    def test_representation_flags(self, kwargs: dict[str, float], expected_epoch: bool) -> None:
+        """Test that is_epoch_based/is_component_based are exact opposites fixed at construction."""
+        value = TemporalValue(True, **kwargs)
+        assert value.is_epoch_based is expected_epoch
+        assert value.is_component_based is not expected_epoch
+
+    def test_starting_epoch_component_based(self) -> None:
+        """Test that component-based values have no starting epoch."""
+        assert TemporalValue(True, hour=1, minute=2).starting_epoch is None
+
+    def test_to_datetime(self) -> None:
+        """Test that epoch seconds are added to the epoch and shifted to the UTC offset."""
+        value = TemporalValue(
+            True, epoch_seconds=700000000.0, utc_offset_hours=1, resolution_seconds=1.0, epoch_start=1
+        )
+        result = value.to_datetime()
+        assert result == datetime(1992, 3, 7, 20, 26, 40, tzinfo=UTC)
+        assert result.tzinfo == timezone(timedelta(hours=1))
+
+    def test_to_timedelta(self) -> None:
+        """Test that a Type M duration converts to timedelta."""
+        value = TemporalValue(True, epoch_seconds=90.5, utc_offset_hours=-16, resolution_seconds=1.0, epoch_start=0)
+        assert value.to_timedelta() == timedelta(seconds=90.5)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"hour": 1, "minute": 2}, "component-based"),
+            ({"epoch_seconds": 1.0, "utc_offset_hours": 1, "epoch_start": 0}, "absolute time"),
+        ],
+        ids=["component", "absolute"],
+    )
+    def test_to_timedelta_raises(self, kwargs: dict[str, float], match: str) -> None:
+        """Test that only durations convert to timedelta."""
+        with pytest.raises(ValueError, match=match):
+            TemporalValue(True, **kwargs).to_timedelta()
+
+    def test_to_datetime_reuses_timezone(self) -> None:
+        """Test that values with the same UTC offset share one tzinfo instance."""
+        first = TemporalValue(True, epoch_seconds=0.0, utc_offset_hours=-5, epoch_start=0).to_datetime()
+        second = TemporalValue(True, epoch_seconds=60.0, utc_offset_hours=-5, epoch_start=0).to_datetime()
+        assert first.tzinfo is second.tzinfo
+
+
+class TestTemporalValueConversion:
+    """Tests for component-based TemporalValue conversions."""
+
+    @pytest.mark.parametrize(
+        ("second", "expected"),
+        [
+            (None, time(14, 30)),
+            (45, time(14, 30, 45)),
+            (45.5, time(14, 30, 45, 500_000)),
+        ],
+        ids=["no_second", "whole_second", "fractional_second"],
+    )
+    def test_to_time(self, second: float | None, expected: time) -> None:
+        """Test that seconds are split into whole seconds and microseconds."""
+        assert TemporalValue(True, hour=14, minute=30, second=second).to_time() == expected
+
+    def test_to_datetime(self) -> None:
+        """Test conversion of a fully specified component-based value."""
+        value = TemporalValue(True, year_2digit=25, year_full=2025, month=3, day=15, hour=14, minute=30, second=7.25)
+        assert value.to_datetime() == datetime(2025, 3, 15, 14, 30, 7, 250_000)
+
+    def test_to_datetime_is_cached(self) -> None:
+        """Test that repeated to_datetime() returns the same converted object."""
+        value = TemporalValue(True, year_2digit=25, year_full=2025, month=3, day=15, hour=14, minute=30)
+        assert value.to_datetime() is value.to_datetime()
+
+    def test_to_datetime_recurring_raises(self) -> None:
+        """Test that recurring patterns cannot be converted."""
+        value = TemporalValue(True, year_2digit=25, year_full=2025, month=15, day=15, hour=14, minute=30)
+        with pytest.raises(ValueError, match="recurring patterns"):
+            value.to_datetime()
+
+
+class TestBooleanArrayValue:
+    """Tests for BooleanArrayValue packed bitmap storage."""
+
+    def test_bool_elements_are_packed(self) -> None:
+        """Test that a tuple of booleans is packed with the first element in bit 0."""
+        value = BooleanArrayValue(True, (True, False, True, False))
+        assert value.bits == 0b0101
+        assert value.length == 4
+
+    def test_boolean_array_value_keyword(self) -> None:
+        """Test that the original boolean_array_value keyword is still accepted."""
+        value = BooleanArrayValue(True, boolean_array_value=(False, True))
+        assert value.bits == 0b10
+        assert value.boolean_array_value == (False, True)
+
+    def test_default_is_empty(self) -> None:
+        """Test that omitting the elements gives an empty array."""
+        assert BooleanArrayValue(False).boolean_array_value == ()
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error", "match"),
+        [
+            ({"bits": 0b101}, TypeError, "length is required"),
+            ({"bits": True}, TypeError, "not a bool"),
+            ({"bits": 0b101, "length": 2}, ValueError, "does not fit"),
+            ({"bits": (True,), "boolean_array_value": (True,)}, TypeError, "not both"),
+        ],
+        ids=["bitmap_without_length", "bool_bits", "bitmap_too_wide", "bits_and_keyword"],
+    )
+    def test_invalid_arguments_raise(self, kwargs: dict[str, object], error: type[Exception], match: str) -> None:
+        """Test that arguments that would silently drop elements are rejected."""
+        with pytest.raises(error, match=match):
+            BooleanArrayValue(True, **kwargs)  # type: ignore[arg-type]
+
+    def test_length_with_bool_elements_raises(self) -> None:
+        """Test that length cannot be combined with boolean elements."""
+        with pytest.raises(TypeError, match="int bitmap"):
+            BooleanArrayValue(True, (True,), 1)
+
+    def test_sequence_access(self) -> None:
+        """Test len, indexing, iteration and tuple unpacking."""
+        value = BooleanArrayValue(True, 0b0110, 4)
+        assert len(value) == 4
+        assert value[1] is True
+        assert value[-1] is False
+        assert list(value) == [False, True, True, False]
+        assert value.boolean_array_value == (False, True, True, False)
+
+    def test_index_out_of_range_raises(self) -> None:
+        """Test that indexing past the length raises IndexError."""
+        with pytest.raises(IndexError):
+            BooleanArrayValue(True, 0b1, 1)[1]
+
+
+class TestTemporalValueStr:
+    """Tests for TemporalValue string representations."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (
+                TemporalValue(True, year_2digit=25, year_full=2025, month=3, day=15, hour=14, minute=30),
+                "2025-03-15 14:30",
+            ),
+            (
+                TemporalValue(True, year_2digit=25, year_full=2025, month=15, day=15, hour=14, minute=30),
+                "2025-*-15 14:30",
+            ),
+            (TemporalValue(True, year_2digit=99, year_full=2099, month=12, day=31), "2099-12-31"),
+            (TemporalValue(True, year_full=2025, month=-1, day=15, hour=14, minute=30), "2025--1-15 14:30"),
+            (TemporalValue(True, year_full=2025, month=100, day=15, hour=100, minute=30), "2025-100-15 100:30"),
+            (TemporalValue(True, year_full=2500, month=1, day=1), "2500-01-01"),
+            (
+                TemporalValue(True, year_2digit=25, year_full=2025, month=3, day=15, hour=14, minute=30, second=5),
+                "2025-03-15 14:30:05",
+            ),
+            (
+                TemporalValue(True, year_2digit=25, year_full=2025, month=2, day=31, hour=14, minute=30, second=5),
+                "2025-02-31 14:30:05",
+            ),
+            (
+                TemporalValue(True, year_full=99, month=3, day=15, hour=14, minute=30, second=5),
+                "99-03-15 14:30:05",
+            ),
+            (TemporalValue(True, hour=14, minute=30, second=45), "14:30:45"),
+            (TemporalValue(True, hour=14, minute=30, second=45.5), "14:30:45.500"),
+            (TemporalValue(True, hour=31, minute=63, second=63), "*:*:*"),
+            (TemporalValue(True, year_2digit=127, day=0), "*-?-*"),
+            (TemporalValue(True), "<empty>"),
+            (
+                TemporalValue(True, epoch_seconds=3600.0, utc_offset_hours=-16, resolution_seconds=1.0, epoch_start=1),
+                "Duration: 3600.0s (res=1.0s)",
+            ),
+            (
+                TemporalValue(
+                    True, epoch_seconds=700000000.0, utc_offset_hours=1, resolution_seconds=1.0, epoch_start=1
+                ),
+                "1992-03-07T21:26:40+01:00 (UTC+1, res=1.0s)",
+            ),
+            (
+                TemporalValue(True, epoch_seconds=0.0, utc_offset_hours=0, resolution_seconds=1.0, epoch_start=7),
+                "<invalid epoch time>",
+            ),
+            (
+                TemporalValue(False, epoch_seconds=0.0, utc_offset_hours=0, resolution_seconds=1.0, epoch_start=1),
+                "<invalid epoch time>",
+            ),
+            (
+                TemporalValue(True, epoch_seconds=0.0, utc_offset_hours=30, resolution_seconds=1.0, epoch_start=0),
+                "<invalid epoch time>",
+            ),
+            (
+                TemporalValue(True, epoch_seconds=0.0, utc_offset_hours=1.5, resolution_seconds=1.0, epoch_start=0),  # type: ignore[arg-type]
+                "<invalid epoch time>",
+            ),
+        ],
+        ids=[
+            "date_time",
+            "every_month",
+            "date_only",
+            "negative_month",
+            "three_digit_components",
+            "year_outside_table",
+            "date_time_seconds",
+            "date_time_out_of_range",
+            "date_time_short_year",
+            "time_only",
+            "fractional_second",
+            "recurring_time",
+            "partial_date",
+            "empty",
+            "duration",
+            "epoch_absolute",
+            "epoch_invalid",
+            "epoch_not_valid",
+            "epoch_offset_out_of_range",
+            "epoch_offset_not_whole_hours",
+        ],
+    )
+    def test_str(self, value: TemporalValue, expected: str) -> None:
+        """Test human-readable formatting of component and epoch values."""
+        assert str(value) == expected
+
+    @pytest.mark.parametrize(
+        "clone",
+        [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+        ids=["copy", "deepcopy", "pickle"],
+    )
+    def test_copy_and_pickle_keep_rendering(self, clone: Callable[[TemporalValue], TemporalValue]) -> None:
+        """Test that copies carry the fields and cached state of the original."""
+        value = TemporalValue(True, year_2digit=25, year_full=2025, month=3, day=15, hour=14, minute=30)
+        rendered = str(value)
+        copied = clone(value)
+        assert copied is not value
+        assert str(copied) == rendered
+        assert copied.is_every_month is False
+
+    def test_str_and_repr_are_cached(self) -> None:
+        """Test that repeated str()/repr() return the same rendered object."""
+        value = TemporalValue(True, hour=14, minute=30)
+        assert str(value) is str(value)
+        assert repr(value) is repr(value)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (
+                TemporalValue(True, hour=14, minute=30),
+                "ValueTemporal(year_2digit=None, year_full=None, month=None, day=None, hour=14, "
+                "minute=30, second=None, is_valid=True)",
+            ),
+            (
+                TemporalValue(True, epoch_seconds=1.0, utc_offset_hours=2, resolution_seconds=1.0, epoch_start=0),
+                "ValueTemporal(epoch_seconds=1.0, utc_offset_hours=2, resolution_seconds=1.0, "
+                "epoch_start=0, is_valid=True)",
+            ),
+        ],
+        ids=["component", "epoch"],
+    )
+    def test_repr(self, value: TemporalValue, expected: str) -> None:
+        """Test developer representation of component and epoch values."""
+        assert repr(value) == expected
@@ -28,12 +28,14 @@ from src.mbusmaster.protocol.vif import (
     ReadoutAnyVIF,
     TrueVIF,
     TrueVIFE,
+    _AbstractFieldDescriptor,
     _CombinableExtensionFieldTable,
     _CombinableOrthogonalFieldTable,
     _decode_ascii_unit,
     _encode_ascii_unit,
     _find_field_descriptor,
     _FirstExtensionFieldTable,
+    _lookup_field_descriptor,
     _PrimaryFieldTable,
     _SecondExtensionFieldTable,
     _SecondExtensionSecondLevelFieldTable,
@@ -176,31 +178,6 @@ class TestFindFieldDescriptor:
         # Should be the same descriptor (extension bit masked out)
         assert desc_no_ext is desc_with_ext
 
-    def test_lru_cache_works(self) -> None:
-        """Test that LRU cache returns cached results on repeated calls."""
-        # Clear cache to start fresh
-        _find_field_descriptor.cache_clear()
-
-        # First call - cache miss
-        _find_field_descriptor(
-            CommunicationDirection.SLAVE_TO_MASTER,
-            TEST_VIF_PRIMARY_ENERGY_WH,
-            _PrimaryFieldTable,
-        )
-        cache_info = _find_field_descriptor.cache_info()
-        assert cache_info.hits == 0
-        assert cache_info.misses == 1
-
-        # Second call with same params - cache hit
-        _find_field_descriptor(
-            CommunicationDirection.SLAVE_TO_MASTER,
-            TEST_VIF_PRIMARY_ENERGY_WH,
-            _PrimaryFieldTable,
-        )
-        cache_info = _find_field_descriptor.cache_info()
-        assert cache_info.hits == 1
-        assert cache_info.misses == 1
-
     def test_invalid_code_raises_error(self) -> None:
         """Test that invalid VIF code raises ValueError."""
         # 0b11101111 (0xEF) is reserved and not implemented in PrimaryFieldTable
@@ -216,6 +193,87 @@ class TestFindFieldDescriptor:
             )
 
 
+class TestLookupFieldDescriptor:
+    """Test the precomputed VIF/VIFE table lookups."""
+
+    @pytest.mark.parametrize(
+        "direction",
+        [
+            CommunicationDirection.MASTER_TO_SLAVE,
+            CommunicationDirection.SLAVE_TO_MASTER,
+            CommunicationDirection.BIDIRECTIONAL,
+        ],
+    )
+    @pytest.mark.parametrize(
+        "field_table",
+        [
+            _PrimaryFieldTable,
+            _FirstExtensionFieldTable,
+            _SecondExtensionFieldTable,
+            _SecondExtensionSecondLevelFieldTable,
+            _CombinableOrthogonalFieldTable,
+            _CombinableExtensionFieldTable,
+        ],
+        ids=["primary", "first_ext", "second_ext", "second_ext_second_level", "comb_orth", "comb_ext"],
+    )
+    def test_matches_table_scan(
+        self, direction: CommunicationDirection, field_table: tuple[_AbstractFieldDescriptor, ...]
+    ) -> None:
+        """Test that every byte resolves to the same descriptor as the table scan."""
+        for field_code in range(256):
+            try:
+                expected = _find_field_descriptor(direction, field_code, field_table)
+            except ValueError:
+                with pytest.raises(ValueError, match=r"not found in VIF/VIFE tables"):
+                    _lookup_field_descriptor(direction, field_code, field_table)
+            else:
+                assert _lookup_field_descriptor(direction, field_code, field_table) is expected
+
+    def test_out_of_range_code_is_masked_like_table_scan(self) -> None:
+        """Test that a code above 0xFF resolves through the descriptor mask instead of raising IndexError."""
+        expected = _find_field_descriptor(CommunicationDirection.SLAVE_TO_MASTER, 0x00, _PrimaryFieldTable)
+        assert _lookup_field_descriptor(CommunicationDirection.SLAVE_TO_MASTER, 0x100, _PrimaryFieldTable) is expected
+
+    def test_out_of_range_code_without_match_raises(self) -> None:
+        """Test that an unmatched code above 0xFF raises ValueError instead of IndexError."""
+        with pytest.raises(ValueError, match=r"not found in VIF/VIFE tables"):
+            _lookup_field_descriptor(CommunicationDirection.MASTER_TO_SLAVE, 0x100, _PrimaryFieldTable)
+
+    def test_unknown_table_falls_back_to_scan(self) -> None:
+        """Test that a table without precomputed lookup is scanned directly."""
+        field_table = _PrimaryFieldTable[:4]
+        assert _lookup_field_descriptor(CommunicationDirection.SLAVE_TO_MASTER, 0x00, field_table) is field_table[0]
+
+    def test_invalid_code_raises_error(self) -> None:
+        """Test that invalid VIF code raises ValueError."""
+        with pytest.raises(
+            ValueError,
+            match=r"VIF/VIFE code 0xEF for direction SLAVE_TO_MASTER not found in VIF/VIFE tables",
+        ):
+            _lookup_field_descriptor(CommunicationDirection.SLAVE_TO_MASTER, 0b11101111, _PrimaryFieldTable)
+
+
+class TestFieldDescriptorSlots:
+    """Test that field descriptors are slotted."""
+
+    @pytest.mark.parametrize(
+        "field_table",
+        [
+            _PrimaryFieldTable,
+            _FirstExtensionFieldTable,
+            _SecondExtensionFieldTable,
+            _SecondExtensionSecondLevelFieldTable,
+            _CombinableOrthogonalFieldTable,
+            _CombinableExtensionFieldTable,
+        ],
+        ids=["primary", "first_ext", "second_ext", "second_ext_second_level", "comb_orth", "comb_ext"],
+    )
+    def test_no_instance_dict(self, field_table: tuple[_AbstractFieldDescriptor, ...]) -> None:
+        """Test that no descriptor in the table carries a __dict__."""
+        for field_descriptor in field_table:
+            assert not hasattr(field_descriptor, "__dict__")
+
+
 class TestDecodeAsciiUnit:
     """Tests for _decode_ascii_unit helper function."""
 